@@ -1,28 +1,43 @@
 """Main CLI entry point for Glimpse RV"""
 
+import importlib
+
 import click
-from dotenv import load_dotenv
 
 from glimpse import __version__
-from glimpse.commands import create, list_cmd, reveal, status
 
-# Load environment variables
-load_dotenv()
+
+class LazyGroup(click.Group):
+    """Click group that imports command modules only when they are invoked"""
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Command name -> (module path, attribute name)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands:
+            module_path, attr_name = self.lazy_commands[cmd_name]
+            module = importlib.import_module(module_path)
+            return getattr(module, attr_name)
+        return super().get_command(ctx, cmd_name)
 
 
-@click.group()
+# Register commands
+@click.group(cls=LazyGroup, lazy_commands={
+    'create': ('glimpse.commands.create', 'create'),
+    'list': ('glimpse.commands.list_cmd', 'list_sessions'),
+    'reveal': ('glimpse.commands.reveal', 'reveal'),
+    'status': ('glimpse.commands.status', 'status'),
+})
 @click.version_option(version=__version__)
 def cli():
     """CLI application for Remote Viewing testing with random target images"""
     pass
 
 
-# Register commands
-cli.add_command(create.create)
-cli.add_command(list_cmd.list_sessions)
-cli.add_command(reveal.reveal)
-cli.add_command(status.status)
-
-
 if __name__ == '__main__':
     cli()
@@ -2,21 +2,52 @@
 
 import os
 import secrets
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from typing import Dict, List
 
 import click
+from dotenv import load_dotenv
 
 from glimpse.services.storage_service import StorageService
-from glimpse.services.unsplash_service import UnsplashService
-from glimpse.services.google_streetview_service import GoogleStreetViewService
-from glimpse.utils.code_generator import generate_code
+from glimpse.utils.code_generator import generate_codes, normalize_code
 from glimpse.utils.helpers import get_data_dir
 
 
+# Pre-rendered banner lines
+_GREEN_BAR = click.style('=' * 58, fg='green')
+_YELLOW_BAR = click.style('=' * 70, fg='yellow')
+_DEBUG_DIVIDER = click.style('-' * 70, fg='bright_black')
+_CREATED_HEADER = '\n'.join([
+    _GREEN_BAR,
+    click.style('  SESSION CREATED', fg='green', bold=True),
+    _GREEN_BAR,
+])
+_DEBUG_HEADER = '\n'.join([
+    _YELLOW_BAR,
+    click.style('  DEBUG: TARGET DETAILS', fg='yellow', bold=True),
+    _YELLOW_BAR,
+])
+_REVEAL_HINT = '\n'.join([
+    '  ' + click.style('Record your impressions, then reveal targets with:', fg='yellow'),
+    '  ' + click.style('glimpse reveal <code>', fg='cyan'),
+])
+
+
+def _get_api_key(name: str):
+    """Get an API key from the environment, reading .env only if it isn't set"""
+    if name not in os.environ:
+        load_dotenv()
+    return os.getenv(name)
+
+
 def get_image_service(source: str):
     """Get the appropriate image service based on source"""
+    # Service modules are imported here so only the selected backend loads
     if source == 'unsplash':
-        api_key = os.getenv('UNSPLASH_ACCESS_KEY')
+        from glimpse.services.unsplash_service import UnsplashService
+
+        api_key = _get_api_key('UNSPLASH_ACCESS_KEY')
         if not api_key:
             raise ValueError(
                 'UNSPLASH_ACCESS_KEY not found in environment.\n'
@@ -26,7 +57,9 @@ def get_image_service(source: str):
         return UnsplashService(api_key)
 
     elif source == 'google_streetview':
-        api_key = os.getenv('GOOGLE_MAPS_API_KEY')
+        from glimpse.services.google_streetview_service import GoogleStreetViewService
+
+        api_key = _get_api_key('GOOGLE_MAPS_API_KEY')
         if not api_key:
             raise ValueError(
                 'GOOGLE_MAPS_API_KEY not found in environment.\n'
@@ -40,6 +73,48 @@ def get_image_service(source: str):
         raise ValueError(f'Unknown image source: {source}')
 
 
+def _fetch_all(image_service, count: int, bar=None) -> List[Dict[str, str]]:
+    """
+    Fetch several random images concurrently
+
+    Args:
+        image_service: Image service to fetch from
+        count: Number of images to fetch
+        bar: Optional click progress bar, advanced as each fetch completes
+
+    Returns:
+        List of image dictionaries, in submission order
+
+    Raises:
+        Exception: The first error raised by any of the fetches
+    """
+    images = [None] * count
+
+    max_workers = min(count, 10)
+    if hasattr(image_service, 'max_parallel_fetches'):
+        # Stay within the fan-out the service's connection pool is sized for
+        max_workers = min(max_workers, image_service.max_parallel_fetches)
+
+    # Don't start more requests at once than the service's rate limit allows
+    if hasattr(image_service, 'limiter'):
+        max_workers = max(1, min(max_workers, image_service.limiter.available()))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(image_service.fetch_random_image): i for i in range(count)}
+
+        try:
+            for future in as_completed(futures):
+                images[futures[future]] = future.result()
+                if bar is not None:
+                    bar.update(1)
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+
+    return images
+
+
 @click.command()
 @click.option('-d', '--duration', default=60, type=int, help='Duration until reveal (in minutes)')
 @click.option('-t', '--targets', default=1, type=int, help='Number of targets to create')
@@ -53,7 +128,7 @@ def create(duration, targets, name, source, debug):
 
     # Validate target count
     if targets < 1 or targets > 10:
-        click.echo(click.style('Error: Target count must be between 1 and 10', fg='red'))
+        click.secho('Error: Target count must be between 1 and 10', fg='red')
         return
 
     # Initialize services
@@ -61,11 +136,11 @@ def create(duration, targets, name, source, debug):
         image_service = get_image_service(source)
         storage = StorageService(get_data_dir())
     except ValueError as e:
-        click.echo(click.style(f'Error: {str(e)}', fg='red'))
+        click.secho(f'Error: {str(e)}', fg='red')
         click.echo()
         return
     except Exception as e:
-        click.echo(click.style(f'Error initializing services: {e}', fg='red'))
+        click.secho(f'Error initializing services: {e}', fg='red')
         return
 
     # Generate session ID
@@ -79,36 +154,42 @@ def create(duration, targets, name, source, debug):
     target_list = []
 
     with click.progressbar(
-        range(targets),
+        length=targets,
         label='Creating targets',
         show_pos=True
     ) as bar:
-        for i in bar:
-            try:
-                # Generate unique code
-                code = generate_code()
-
-                # Fetch random image
-                image = image_service.fetch_random_image()
-
-                target_dict = {
-                    'code': code,
-                    'targetUrl': image['url'],  # Street View panorama URL
-                    'targetDescription': image['description'],
-                    'targetSource': image_service.name,
-                    'revealed': False
-                }
-
-                # Add optional fields if available
-                if image.get('locationUrl'):
-                    target_dict['targetLocationUrl'] = image['locationUrl']
-                if image.get('date'):
-                    target_dict['targetDate'] = image['date']
-
-                target_list.append(target_dict)
-            except Exception as e:
-                click.echo(click.style(f'\nError creating target: {e}', fg='red'))
-                return
+        try:
+            if hasattr(image_service, 'fetch_random_images'):
+                # Fetch all images in one batched request
+                images = image_service.fetch_random_images(targets)
+                bar.update(targets)
+            else:
+                # Fetch all images concurrently
+                images = _fetch_all(image_service, targets, bar)
+        except Exception as e:
+            click.secho(f'\nError creating target: {e}', fg='red')
+            return
+
+    # Generate unique codes
+    codes = generate_codes(targets)
+
+    for code, image in zip(codes, images):
+        target_dict = {
+            'code': code,
+            'codeNormalized': normalize_code(code),
+            'targetUrl': image['url'],  # Street View panorama URL
+            'targetDescription': image['description'],
+            'targetSource': image_service.name,
+            'revealed': False
+        }
+
+        # Add optional fields if available
+        if image.get('locationUrl'):
+            target_dict['targetLocationUrl'] = image['locationUrl']
+        if image.get('date'):
+            target_dict['targetDate'] = image['date']
+
+        target_list.append(target_dict)
 
     # Create session
     session = {
@@ -116,21 +197,20 @@ def create(duration, targets, name, source, debug):
         'name': name,
         'targets': target_list,
         'createdAt': created_at.isoformat(),
-        'revealAt': reveal_at.isoformat()
+        'revealAt': reveal_at.isoformat(),
+        'revealAtEpoch': int(reveal_at.timestamp())
     }
 
     # Save session
     try:
         storage.save_session(session)
     except Exception as e:
-        click.echo(click.style(f'Error saving session: {e}', fg='red'))
+        click.secho(f'Error saving session: {e}', fg='red')
         return
 
     # Display session info
     click.echo()
-    click.echo(click.style('=' * 58, fg='green'))
-    click.echo(click.style('  SESSION CREATED', fg='green', bold=True))
-    click.echo(click.style('=' * 58, fg='green'))
+    click.echo(_CREATED_HEADER)
 
     click.echo()
     if name:
@@ -147,26 +227,25 @@ def create(duration, targets, name, source, debug):
     click.echo()
     created_str = created_at.strftime('%Y-%m-%d %H:%M:%S')
     reveal_str = reveal_at.strftime('%Y-%m-%d %H:%M:%S')
-    click.echo(f'  Created: {click.style(created_str, fg="bright_black")}')
-    click.echo(f'  Reveal At: {click.style(reveal_str, fg="bright_black")}')
-    click.echo(f'  Duration: {click.style(f"{duration} minutes", fg="bright_black")}')
+    click.echo('\n'.join([
+        f'  Created: {click.style(created_str, fg="bright_black")}',
+        f'  Reveal At: {click.style(reveal_str, fg="bright_black")}',
+        f'  Duration: {click.style(f"{duration} minutes", fg="bright_black")}',
+    ]))
     click.echo()
-    click.echo('  ' + click.style('Record your impressions, then reveal targets with:', fg='yellow'))
-    click.echo('  ' + click.style('glimpse reveal <code>', fg='cyan'))
+    click.echo(_REVEAL_HINT)
     click.echo()
-    click.echo(click.style('=' * 58, fg='green'))
+    click.echo(_GREEN_BAR)
     click.echo()
 
     # Debug output
     if debug:
         click.echo()
-        click.echo(click.style('=' * 70, fg='yellow'))
-        click.echo(click.style('  DEBUG: TARGET DETAILS', fg='yellow', bold=True))
-        click.echo(click.style('=' * 70, fg='yellow'))
+        click.echo(_DEBUG_HEADER)
         click.echo()
 
         for i, target in enumerate(target_list, 1):
-            click.echo(click.style(f'Target {i}: {target["code"]}', fg='cyan', bold=True))
+            click.secho(f'Target {i}: {target["code"]}', fg='cyan', bold=True)
             click.echo()
             click.echo(f'  Description: {target["targetDescription"]}')
             click.echo()
@@ -183,8 +262,8 @@ def create(duration, targets, name, source, debug):
                 click.echo(f'  Captured: {target["targetDate"]}')
                 click.echo()
 
-            click.echo(click.style('-' * 70, fg='bright_black'))
+            click.echo(_DEBUG_DIVIDER)
             click.echo()
 
-        click.echo(click.style('=' * 70, fg='yellow'))
+        click.echo(_YELLOW_BAR)
         click.echo()
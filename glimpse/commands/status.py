@@ -1,11 +1,20 @@
 """Status command for checking sessions"""
 
-from datetime import datetime
+import time
 
 import click
 
 from glimpse.services.storage_service import StorageService
-from glimpse.utils.helpers import get_data_dir
+from glimpse.utils.helpers import get_data_dir, get_reveal_epoch
+
+
+# Pre-rendered banner lines
+_CYAN_BAR = click.style('-' * 50, fg='cyan')
+_HEADER = '\n'.join([
+    _CYAN_BAR,
+    click.style('  GLIMPSE RV STATUS', fg='cyan', bold=True),
+    _CYAN_BAR,
+])
 
 
 @click.command()
@@ -14,54 +23,50 @@ def status():
 
     storage = StorageService(get_data_dir())
 
-    sessions = storage.get_all_sessions()
+    now = time.time()
 
-    if not sessions:
-        click.echo(click.style('\nNo sessions found.', fg='yellow'))
-        click.echo(click.style('Create one with: glimpse create\n', fg='bright_black'))
-        return
+    # Read each session once, reduced to the fields status needs. Revealed
+    # flags live in session.json and its journal, so they are counted from
+    # the session data itself.
+    summaries = list(storage.iter_session_summaries())
+    total_sessions = len(summaries)
 
-    now = datetime.now()
+    if not total_sessions:
+        click.secho('\nNo sessions found.', fg='yellow')
+        click.secho('Create one with: glimpse create\n', fg='bright_black')
+        return
 
-    # Count totals
-    total_sessions = len(sessions)
-    total_targets = sum(len(s['targets']) for s in sessions)
-    revealed_targets = sum(sum(1 for t in s['targets'] if t['revealed']) for s in sessions)
+    ready = [s for s in summaries if now >= get_reveal_epoch(s)]
+    ready_sessions = len(ready)
 
-    def is_ready(session):
-        reveal_at = datetime.fromisoformat(session['revealAt'])
-        if reveal_at.tzinfo is not None:
-            reveal_at = reveal_at.replace(tzinfo=None)
-        return now >= reveal_at
+    total_targets = sum(len(s['targets']) for s in summaries)
+    revealed_targets = sum(t['revealed'] for s in summaries for t in s['targets'])
 
-    ready_sessions = sum(1 for s in sessions if is_ready(s))
+    # Newest first, matching list
+    ready.sort(key=lambda s: s['createdAt'] or '', reverse=True)
 
     click.echo()
-    click.echo(click.style('-' * 50, fg='cyan'))
-    click.echo(click.style('  GLIMPSE RV STATUS', fg='cyan', bold=True))
-    click.echo(click.style('-' * 50, fg='cyan'))
+    click.echo(_HEADER)
     click.echo()
-    click.echo(f"  Total Sessions: {click.style(str(total_sessions), fg='green', bold=True)}")
-    click.echo(f"  Ready to Reveal: {click.style(str(ready_sessions), fg='yellow', bold=True)}")
-    click.echo(f"  Total Targets: {click.style(str(total_targets), fg='cyan', bold=True)}")
-    click.echo(f"  Revealed: {click.style(str(revealed_targets), fg='green', bold=True)} / Pending: {click.style(str(total_targets - revealed_targets), fg='yellow', bold=True)}")
+    click.echo('\n'.join([
+        f"  Total Sessions: {click.style(str(total_sessions), fg='green', bold=True)}",
+        f"  Ready to Reveal: {click.style(str(ready_sessions), fg='yellow', bold=True)}",
+        f"  Total Targets: {click.style(str(total_targets), fg='cyan', bold=True)}",
+        f"  Revealed: {click.style(str(revealed_targets), fg='green', bold=True)} / Pending: {click.style(str(total_targets - revealed_targets), fg='yellow', bold=True)}",
+    ]))
     click.echo()
 
     if ready_sessions > 0:
-        click.echo(click.style('  Sessions ready to reveal:', fg='green', bold=True))
+        click.secho('  Sessions ready to reveal:', fg='green', bold=True)
         click.echo()
-        for session in sessions:
-            reveal_at = datetime.fromisoformat(session['revealAt'])
-            if reveal_at.tzinfo is not None:
-                reveal_at = reveal_at.replace(tzinfo=None)
-            if now >= reveal_at:
-                name = session.get('name') or session['id']
-                unrevealed = [t for t in session['targets'] if not t['revealed']]
-                if unrevealed:
-                    click.echo(f"    * {click.style(name, fg='cyan')}")
-                    for target in unrevealed:
-                        click.echo(f"      - {click.style(target['code'], fg='yellow')}")
+        for session in ready:
+            name = session.get('name') or session['id']
+            unrevealed = [t for t in session['targets'] if not t['revealed']]
+            if unrevealed:
+                click.echo(f"    * {click.style(name, fg='cyan')}")
+                for target in unrevealed:
+                    click.echo(f"      - {click.style(target['code'], fg='yellow')}")
         click.echo()
 
-    click.echo(click.style('-' * 50, fg='cyan'))
+    click.echo(_CYAN_BAR)
     click.echo()
@@ -0,0 +1,74 @@
+"""Typed session and target records hydrated from stored session data"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from glimpse.utils.helpers import get_reveal_epoch, parse_naive_datetime
+
+
+@dataclass(frozen=True)
+class Target:
+    """A single RV target"""
+
+    code: str
+    revealed: bool
+    target_url: str
+    target_description: str
+    target_source: str
+    target_location_url: Optional[str] = None
+    target_date: Optional[str] = None
+    revealed_at: Optional[datetime] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Target':
+        """
+        Build a Target from its stored dictionary form
+
+        Only code and revealed are required; other missing fields get
+        defaults and an unparseable revealedAt is treated as unset.
+        """
+        try:
+            revealed_at = parse_naive_datetime(data['revealedAt'])
+        except (KeyError, TypeError, ValueError):
+            revealed_at = None
+
+        return cls(
+            code=data['code'],
+            revealed=data['revealed'],
+            target_url=data.get('targetUrl', ''),
+            target_description=data.get('targetDescription', ''),
+            target_source=data.get('targetSource', 'unsplash'),
+            target_location_url=data.get('targetLocationUrl'),
+            target_date=data.get('targetDate'),
+            revealed_at=revealed_at
+        )
+
+
+@dataclass(frozen=True)
+class Session:
+    """An RV session with its timestamps already parsed"""
+
+    id: str
+    name: Optional[str]
+    created_at: datetime
+    reveal_at: datetime
+    reveal_epoch: float
+    targets: Tuple[Target, ...]
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Session':
+        """Build a Session from its stored dictionary form"""
+        return cls(
+            id=data['id'],
+            name=data.get('name'),
+            created_at=parse_naive_datetime(data['createdAt']),
+            reveal_at=parse_naive_datetime(data['revealAt']),
+            reveal_epoch=get_reveal_epoch(data),
+            targets=tuple(Target.from_dict(t) for t in data['targets'])
+        )
+
+    @property
+    def revealed_count(self) -> int:
+        """Number of targets already revealed"""
+        return sum(t.revealed for t in self.targets)
@@ -1,10 +1,57 @@
 """Google Street View API service for fetching random Street View images"""
 
+import functools
+import itertools
 import math
 import random
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Tuple, Optional
 
+from glimpse.utils.rate_limit import TokenBucket, get_with_retry
+
+
+# Coarse regions with dense Street View coverage, used to bias random sampling
+# away from oceans and uncovered land.
+# Each entry: (min_lat, max_lat, min_lon, max_lon, weight)
+_COVERAGE_REGIONS = [
+    (25.0, 49.0, -124.0, -67.0, 20.0),    # Contiguous United States
+    (43.0, 55.0, -130.0, -60.0, 5.0),     # Southern Canada
+    (15.0, 32.0, -117.0, -87.0, 4.0),     # Mexico
+    (-33.0, -3.0, -55.0, -35.0, 5.0),     # Brazil
+    (-55.0, -22.0, -75.0, -55.0, 3.0),    # Argentina and Chile
+    (-18.0, 11.0, -81.0, -70.0, 2.0),     # Colombia, Ecuador and Peru
+    (36.0, 60.0, -10.0, 30.0, 18.0),      # Western and Central Europe
+    (55.0, 70.0, 5.0, 31.0, 3.0),         # Scandinavia and Finland
+    (44.0, 60.0, 30.0, 60.0, 4.0),        # Eastern Europe and western Russia
+    (36.0, 42.0, 26.0, 45.0, 2.0),        # Turkey
+    (29.5, 33.3, 34.2, 35.9, 0.5),        # Israel
+    (8.0, 30.0, 68.0, 90.0, 3.0),         # India
+    (31.0, 45.0, 129.0, 146.0, 5.0),      # Japan
+    (34.0, 38.5, 126.0, 129.5, 2.0),      # South Korea
+    (22.0, 25.3, 120.0, 122.0, 1.0),      # Taiwan
+    (-9.0, 20.0, 95.0, 125.0, 5.0),       # Southeast Asia
+    (-39.0, -16.0, 114.0, 154.0, 5.0),    # Australia
+    (-47.0, -34.0, 166.0, 179.0, 1.5),    # New Zealand
+    (-35.0, -22.0, 16.0, 33.0, 2.0),      # South Africa
+    (-5.0, 4.0, 29.0, 42.0, 1.0),         # Kenya and Uganda
+]
+_COVERAGE_CUM_WEIGHTS = list(itertools.accumulate(region[4] for region in _COVERAGE_REGIONS))
+
+# Geocoding addresses that indicate open water
+_OCEAN_RE = re.compile(r'\b(?:ocean|sea|mediterranean|atlantic|pacific|indian ocean)\b', re.IGNORECASE)
+
+# Geocoding result types that indicate a real address on land
+_LAND_TYPES = frozenset([
+    'street_address', 'route', 'premise', 'locality',
+    'sublocality', 'postal_code', 'administrative_area',
+    'political', 'country'
+])
+
 
 class GoogleStreetViewService:
     """Service for interacting with Google Street View Static API"""
@@ -24,6 +71,29 @@ class GoogleStreetViewService:
         # Max retries when looking for valid Street View locations
         self.max_retries = 20
 
+        # Number of candidate locations checked at once
+        self.concurrency = 5
+
+        # Most images fetched at once by callers (see create._fetch_all); each
+        # fetch checks self.concurrency candidates in parallel
+        self.max_parallel_fetches = 10
+
+        # Memoize API lookups by coordinates rounded to ~100m
+        self._geocode_lookup = functools.lru_cache(maxsize=4096)(self._fetch_geocode)
+        self._metadata_lookup = functools.lru_cache(maxsize=4096)(self._fetch_metadata)
+
+        # Reuse connections to maps.googleapis.com across requests. The pool
+        # holds one connection per request that can be in flight at once, so
+        # none are discarded when they are returned.
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.max_parallel_fetches * self.concurrency
+        ))
+
+        # Stay well under the Maps Platform per-second quota
+        self.limiter = TokenBucket(rate=50, per=1)
+
     def _generate_random_coordinates(self) -> Tuple[float, float]:
         """
         Generate random latitude and longitude coordinates
@@ -31,14 +101,15 @@ class GoogleStreetViewService:
         Returns:
             Tuple of (latitude, longitude)
         """
-        # Generate random coordinates
-        # Bias towards populated areas by using a weighted distribution
-        # This increases chances of finding Street View coverage
+        # Bias towards areas with Street View coverage by picking a region
+        # by weight, then a uniform point within it. Far fewer candidates
+        # land in the ocean than with a uniform global distribution.
+        min_lat, max_lat, min_lon, max_lon, _ = random.choices(
+            _COVERAGE_REGIONS, cum_weights=_COVERAGE_CUM_WEIGHTS
+        )[0]
 
-        # For now, use uniform distribution
-        # Future enhancement: Use a database of known Street View locations
-        lat = random.uniform(-85, 85)  # Avoid extreme poles
-        lon = random.uniform(-180, 180)
+        lat = random.uniform(min_lat, max_lat)
+        lon = random.uniform(min_lon, max_lon)
 
         return lat, lon
 
@@ -67,6 +138,58 @@ class GoogleStreetViewService:
 
         return R * c
 
+    def _fetch_geocode(self, key: Tuple[float, float]) -> Dict:
+        """
+        Reverse geocode coordinates (cached via self._geocode_lookup)
+
+        Args:
+            key: Tuple of (latitude, longitude), rounded by the caller
+
+        Returns:
+            Geocoding API response data
+        """
+        lat, lon = key
+        geocode_url = 'https://maps.googleapis.com/maps/api/geocode/json'
+        params = {
+            'latlng': f'{lat},{lon}',
+            'key': self.api_key
+        }
+
+        response = get_with_retry(self.session, self.limiter, geocode_url, params=params, timeout=10)
+        response.raise_for_status()
+
+        return response.json()
+
+    def _fetch_metadata(self, key: Tuple[float, float], radius: Optional[int] = None) -> Dict:
+        """
+        Fetch Street View metadata for coordinates (cached via self._metadata_lookup)
+
+        Args:
+            key: Tuple of (latitude, longitude), rounded by the caller
+            radius: Optional search radius in meters
+
+        Returns:
+            Street View metadata API response data
+        """
+        lat, lon = key
+        params = {
+            'location': f'{lat},{lon}',
+            'key': self.api_key
+        }
+        if radius is not None:
+            params['radius'] = radius
+
+        response = get_with_retry(
+            self.session,
+            self.limiter,
+            self.metadata_url,
+            params=params,
+            timeout=10
+        )
+        response.raise_for_status()
+
+        return response.json()
+
     def _is_valid_location(self, lat: float, lon: float) -> bool:
         """
         Check if coordinates are on land using reverse geocoding
@@ -88,16 +211,7 @@ class GoogleStreetViewService:
 
         # Use reverse geocoding to verify this is a land location
         try:
-            geocode_url = 'https://maps.googleapis.com/maps/api/geocode/json'
-            params = {
-                'latlng': f'{lat},{lon}',
-                'key': self.api_key
-            }
-
-            response = requests.get(geocode_url, params=params, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._geocode_lookup((round(lat, 3), round(lon, 3)))
 
             # Check if we got valid results
             if data.get('status') != 'OK' or not data.get('results'):
@@ -106,18 +220,12 @@ class GoogleStreetViewService:
 
             # Check if any result indicates this is a real address on land
             for result in data['results']:
-                types = result.get('types', [])
-                formatted_address = result.get('formatted_address', '').lower()
-
                 # Explicitly reject if it's clearly water/ocean in the address
-                if any(word in formatted_address for word in ['ocean', 'sea', 'mediterranean', 'atlantic', 'pacific', 'indian ocean']):
+                if _OCEAN_RE.search(result.get('formatted_address', '')):
                     return False
 
                 # Accept if it has a street address, route, or locality
-                good_types = ['street_address', 'route', 'premise', 'locality',
-                              'sublocality', 'postal_code', 'administrative_area',
-                              'political', 'country']
-                if any(t in types for t in good_types):
+                if not _LAND_TYPES.isdisjoint(result.get('types', [])):
                     return True
 
             # If we got results but none matched, allow it (might be remote area)
@@ -127,32 +235,35 @@ class GoogleStreetViewService:
             # If geocoding fails, allow it (don't be too strict)
             return True
 
-    def _check_streetview_availability(self, lat: float, lon: float) -> Optional[Dict]:
+    def _check_streetview_availability(self, lat: float, lon: float,
+                                       found: Optional[threading.Event] = None,
+                                       validate_lock: Optional[threading.Lock] = None) -> Optional[Dict]:
         """
         Check if Street View is available at the given coordinates
 
         Args:
             lat: Latitude
             lon: Longitude
+            found: Optional event shared by a batch of candidates. It is set on
+                success, and once set the remaining candidates stop before
+                making further API calls.
+            validate_lock: Optional lock shared by the batch, so only one
+                candidate at a time spends a geocoding call on validation
 
         Returns:
             Dictionary with metadata if available, None otherwise
         """
-        try:
-            params = {
-                'location': f'{lat},{lon}',
-                'key': self.api_key,
-                'radius': 50000  # Search radius in meters (50km)
-            }
+        if found is None:
+            found = threading.Event()
+        if validate_lock is None:
+            validate_lock = threading.Lock()
 
-            response = requests.get(
-                self.metadata_url,
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
+        try:
+            if found.is_set():
+                return None
 
-            metadata = response.json()
+            # Search radius in meters (50km)
+            metadata = self._metadata_lookup((round(lat, 3), round(lon, 3)), 50000)
 
             # Check if Street View is available at this location
             if metadata.get('status') == 'OK':
@@ -163,16 +274,22 @@ class GoogleStreetViewService:
                 if actual_lat is None or actual_lon is None:
                     return None
 
-                # Validate the returned coordinates
-                if not self._is_valid_location(actual_lat, actual_lon):
-                    return None
-
                 # Check distance between requested and returned location
                 # Reject if too far (indicates no nearby Street View)
                 distance = self._calculate_distance(lat, lon, actual_lat, actual_lon)
                 if distance > 50000:  # More than 50km away
                     return None
 
+                with validate_lock:
+                    if found.is_set():
+                        return None
+
+                    # Validate the returned coordinates
+                    if not self._is_valid_location(actual_lat, actual_lon):
+                        return None
+
+                    found.set()
+
                 return metadata
             else:
                 return None
@@ -180,6 +297,42 @@ class GoogleStreetViewService:
         except requests.exceptions.RequestException:
             return None
 
+    def _find_streetview_location(self) -> Optional[Dict]:
+        """
+        Search random coordinates for Street View coverage
+
+        Candidates are checked concurrently in batches of self.concurrency,
+        returning as soon as any of them succeeds. At most self.max_retries
+        candidates are checked in total.
+
+        Returns:
+            Metadata for the first location found, None if all candidates failed
+        """
+        attempts = 0
+
+        while attempts < self.max_retries:
+            batch_size = min(self.concurrency, self.max_retries - attempts)
+            attempts += batch_size
+
+            # Tells the rest of the batch to stop making API calls once one
+            # candidate succeeds
+            found = threading.Event()
+            validate_lock = threading.Lock()
+
+            with ThreadPoolExecutor(max_workers=batch_size) as executor:
+                futures = [
+                    executor.submit(self._check_streetview_availability,
+                                    *self._generate_random_coordinates(), found, validate_lock)
+                    for _ in range(batch_size)
+                ]
+
+                for future in as_completed(futures):
+                    metadata = future.result()
+                    if metadata:
+                        return metadata
+
+        return None
+
     def fetch_random_image(self) -> Dict[str, str]:
         """
         Fetch a random Street View location with interactive panorama link
@@ -194,54 +347,45 @@ class GoogleStreetViewService:
         Raises:
             Exception: If unable to find a valid Street View location after max retries
         """
-        attempts = 0
-
-        while attempts < self.max_retries:
-            attempts += 1
+        metadata = self._find_streetview_location()
 
-            # Generate random coordinates
-            lat, lon = self._generate_random_coordinates()
+        if metadata:
+            # Street View found! Generate the panorama URL
+            actual_lat = metadata['location']['lat']
+            actual_lon = metadata['location']['lng']
+            pano_id = metadata.get('pano_id', '')
 
-            # Check if Street View is available
-            metadata = self._check_streetview_availability(lat, lon)
+            # Random heading direction for variety
+            heading = random.randint(0, 359)
 
-            if metadata:
-                # Street View found! Generate the panorama URL
-                actual_lat = metadata['location']['lat']
-                actual_lon = metadata['location']['lng']
-                pano_id = metadata.get('pano_id', '')
-
-                # Random heading direction for variety
-                heading = random.randint(0, 359)
-
-                # Build Google Maps URL for Street View using panorama ID
-                if pano_id:
-                    # Use panorama ID for reliable Street View link
-                    streetview_url = f'https://www.google.com/maps/@?api=1&map_action=pano&pano={pano_id}&heading={heading}&pitch=0&fov=90'
-                else:
-                    # Fallback to coordinate-based link
-                    streetview_url = f'https://www.google.com/maps/@{actual_lat},{actual_lon},3a,75y,{heading}h,90t/data=!3m6!1e1'
+            # Build Google Maps URL for Street View using panorama ID
+            if pano_id:
+                # Use panorama ID for reliable Street View link
+                streetview_url = f'https://www.google.com/maps/@?api=1&map_action=pano&pano={pano_id}&heading={heading}&pitch=0&fov=90'
+            else:
+                # Fallback to coordinate-based link
+                streetview_url = f'https://www.google.com/maps/@{actual_lat},{actual_lon},3a,75y,{heading}h,90t/data=!3m6!1e1'
 
-                # Build regular Google Maps URL for the exact location
-                maps_location_url = f'https://www.google.com/maps?q={actual_lat},{actual_lon}'
+            # Build regular Google Maps URL for the exact location
+            maps_location_url = f'https://www.google.com/maps?q={actual_lat},{actual_lon}'
 
-                # Generate description
-                description = f'Street View at coordinates {actual_lat:.6f}, {actual_lon:.6f}'
+            # Generate description
+            description = f'Street View at coordinates {actual_lat:.6f}, {actual_lon:.6f}'
 
-                # Extract metadata
-                date = metadata.get('date')
+            # Extract metadata
+            date = metadata.get('date')
 
-                result = {
-                    'url': streetview_url,
-                    'description': description,
-                    'locationUrl': maps_location_url
-                }
+            result = {
+                'url': streetview_url,
+                'description': description,
+                'locationUrl': maps_location_url
+            }
 
-                # Add optional metadata if available
-                if date:
-                    result['date'] = date
+            # Add optional metadata if available
+            if date:
+                result['date'] = date
 
-                return result
+            return result
 
         # If we get here, we failed to find a valid location
         raise Exception(
@@ -253,19 +397,7 @@ class GoogleStreetViewService:
         """Test the Google Street View API connection using a known location"""
         try:
             # Test with Times Square, NYC - known to have Street View
-            params = {
-                'location': '40.758896,-73.985130',
-                'key': self.api_key
-            }
-
-            response = requests.get(
-                self.metadata_url,
-                params=params,
-                timeout=10
-            )
-            response.raise_for_status()
-
-            metadata = response.json()
+            metadata = self._metadata_lookup((40.759, -73.985))
             return metadata.get('status') == 'OK'
 
         except Exception:
@@ -1,13 +1,86 @@
 """JSON storage service for RV sessions"""
 
+import hashlib
 import json
 import os
+import re
 import shutil
+import stat
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from glimpse.utils.helpers import format_capture_date
+from glimpse.models import Session
+from glimpse.utils.code_generator import normalize_code
+from glimpse.utils.helpers import format_capture_date, get_reveal_epoch, parse_naive_datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Number of journaled target updates kept before a session is compacted
+JOURNAL_COMPACT_THRESHOLD = 20
+
+# Session fields that appear in the markdown summary; updates touching
+# only other fields leave session.md as it is
+MARKDOWN_FIELDS = frozenset({'name', 'notes', 'targets', 'revealAt', 'createdAt'})
+
+# Mode for newly written files, as open() would create them under the umask
+# (read once at import, since os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_DEFAULT_FILE_MODE = 0o666 & ~_UMASK
+
+# Blob names are SHA-256 hex digests
+_BLOB_HASH_RE = re.compile(r'[0-9a-f]{64}')
+
+# Timestamp fields parsed once on load, mapped to the key caching the datetime.
+# Underscore-prefixed keys are never written to disk.
+_DATETIME_FIELDS = {'createdAt': '_created_dt', 'revealAt': '_reveal_dt'}
+
+def _dumps(data, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_atomic(path: str, data: bytes):
+    """Write a file via a temp file and rename, so readers never see a partial write"""
+    # A unique temp file per write keeps concurrent writers from sharing one
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+
+        # mkstemp creates files as 0600; keep the existing file's mode instead
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = _DEFAULT_FILE_MODE
+        os.chmod(tmp_path, mode)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def format_timestamp(iso_timestamp: str) -> str:
@@ -19,12 +92,77 @@ def format_timestamp(iso_timestamp: str) -> str:
         return iso_timestamp
 
 
+def _fmt_dt(value) -> str:
+    """Format a datetime, or an ISO timestamp that still needs parsing"""
+    if isinstance(value, datetime):
+        return value.strftime('%B %d, %Y at %I:%M:%S %p')
+    return format_timestamp(value)
+
+
+_MARKDOWN_FOOTER = '\n---\n\n*Generated by Glimpse RV Testing CLI*'
+
+
+def _render_target(number: int, target: Dict) -> str:
+    """Render one target's section of the session markdown summary"""
+    # Generate appropriate link text based on source
+    source = target.get('targetSource', 'unsplash')
+    target_url = target.get('targetUrl', '')
+    location_url = target.get('targetLocationUrl')
+
+    if source == 'google_streetview':
+        link = f"**Street View:**\n\n[View Interactive Panorama]({target_url})\n"
+        if location_url:
+            link += f" • [View Location on Map]({location_url})\n"
+    else:
+        link_text = 'View on Unsplash' if source == 'unsplash' else 'View Source'
+        link = f"**Image:**\n\n![Target Image]({target_url})\n\n[{link_text}]({target_url})\n"
+
+    # Add metadata for Street View
+    captured = ''
+    if source == 'google_streetview' and target.get('targetDate'):
+        captured = f"**Captured:** {format_capture_date(target['targetDate'])}\n\n"
+
+    revealed_at = ''
+    if target.get('revealedAt'):
+        revealed_at = f"**Revealed At:** {format_timestamp(target['revealedAt'])}\n"
+
+    status = 'Revealed' if target['revealed'] else 'Pending'
+
+    return (
+        f"### Target {number}: {target['code']}\n"
+        f"\n"
+        f"**Code:** `{target['code']}`\n"
+        f"**Status:** {status}\n"
+        f"**Source:** {source}\n"
+        f"\n"
+        f"**Description:**\n"
+        f"\n"
+        f"{target.get('targetDescription', '')}\n"
+        f"\n"
+        f"{link}"
+        f"\n"
+        f"{captured}"
+        f"{revealed_at}"
+        f"\n"
+        f"---\n"
+        f"\n"
+    )
+
+
 class StorageService:
     """Service for storing and retrieving RV sessions"""
 
     def __init__(self, data_dir: str):
         self.data_dir = data_dir
         self.sessions_dir = os.path.join(data_dir, 'sessions')
+        self.index_path = os.path.join(data_dir, 'index.json')
+        self.blobs_dir = os.path.join(data_dir, 'blobs')
+        self._code_map: Optional[Dict[str, Dict]] = None
+        # Session ID -> folder name, built on first lookup. The sessions
+        # directory mtime it was built from acts as its version, so folders
+        # added or removed by another process trigger a rescan.
+        self._dir_index: Optional[Dict[str, str]] = None
+        self._dir_index_mtime: Optional[int] = None
 
     def _get_session_dir(self, session_id: str, session_data: Optional[Dict] = None) -> str:
         """
@@ -39,22 +177,68 @@ class StorageService:
         """
         # If creating a new session, use timestamp prefix
         if session_data and 'createdAt' in session_data:
-            created_at = datetime.fromisoformat(session_data['createdAt'])
+            created_at = session_data.get('_created_dt') or datetime.fromisoformat(session_data['createdAt'])
             timestamp = created_at.strftime('%Y%m%d%H%M')
             folder_name = f"{timestamp}_{session_id}"
             return os.path.join(self.sessions_dir, folder_name)
 
         # Otherwise, find existing folder by session_id
-        try:
-            for entry in os.listdir(self.sessions_dir):
-                if entry.endswith(f'_{session_id}') or entry == session_id:
-                    return os.path.join(self.sessions_dir, entry)
-        except FileNotFoundError:
-            pass
+        existing = self._find_session_dir(session_id)
+        if existing:
+            return existing
 
         # Fallback to session_id only (for backwards compatibility)
         return os.path.join(self.sessions_dir, session_id)
 
+    def _ensure_dir_index(self) -> Dict[str, str]:
+        """Get the session ID -> folder name index, rescanning if the sessions directory changed"""
+        try:
+            mtime = os.stat(self.sessions_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._dir_index, self._dir_index_mtime = {}, None
+            return self._dir_index
+
+        if self._dir_index is None or mtime != self._dir_index_mtime:
+            index = {}
+            with os.scandir(self.sessions_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        index[self._session_id_from_folder(entry.name)] = entry.name
+            self._dir_index, self._dir_index_mtime = index, mtime
+
+        return self._dir_index
+
+    def _sync_dir_index(self, session_id: str, folder_name: Optional[str]):
+        """Record a folder change made by this instance in the directory index"""
+        if self._dir_index is None:
+            return
+
+        if folder_name is None:
+            self._dir_index.pop(session_id, None)
+        else:
+            self._dir_index[session_id] = folder_name
+
+        try:
+            self._dir_index_mtime = os.stat(self.sessions_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._dir_index = None
+
+    def _find_session_dir(self, session_id: str) -> Optional[str]:
+        """Find the existing directory for a session, if any"""
+        folder_name = self._ensure_dir_index().get(session_id)
+        if folder_name:
+            return os.path.join(self.sessions_dir, folder_name)
+
+        # Not indexed (e.g. an unusually named folder): fall back to a full scan
+        try:
+            with os.scandir(self.sessions_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(f'_{session_id}') or entry.name == session_id:
+                        return entry.path
+        except FileNotFoundError:
+            pass
+        return None
+
     def _get_session_path(self, session_id: str) -> str:
         """Get the JSON file path for a session"""
         return os.path.join(self._get_session_dir(session_id), 'session.json')
@@ -63,161 +247,370 @@ class StorageService:
         """Get the markdown file path for a session"""
         return os.path.join(self._get_session_dir(session_id), 'session.md')
 
+    def _session_id_from_folder(self, folder_name: str) -> str:
+        """Extract the session ID from a session folder name"""
+        # Format: {timestamp}_{session_id} or just {session_id}
+        if '_' in folder_name and len(folder_name.split('_')[0]) == 12:
+            # New format with timestamp
+            return folder_name.rsplit('_', 1)[1]
+        # Old format or session_id only
+        return folder_name
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """Load the code index (normalized code -> session location)"""
+        try:
+            with open(self.index_path, 'rb') as f:
+                return _loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_index(self, index: Dict[str, Dict]):
+        """Write the code index to disk"""
+        Path(self.data_dir).mkdir(parents=True, exist_ok=True)
+        _write_atomic(self.index_path, _dumps(index))
+
+    def _get_code_map(self) -> Dict[str, Dict]:
+        """Get the in-memory code map, loading it from the index on first use"""
+        if self._code_map is None:
+            self._code_map = self._load_index()
+        return self._code_map
+
+    def _target_code(self, target: Dict) -> str:
+        """Get a target's normalized code, preferring the precomputed value"""
+        return target.get('codeNormalized') or normalize_code(target['code'])
+
+    def _index_entries(self, session: Dict, folder_name: str) -> Dict[str, Dict]:
+        """Build code index entries for every target in a session"""
+        return {
+            self._target_code(target): {
+                'sessionId': session['id'],
+                'folder': folder_name,
+                'target': i
+            }
+            for i, target in enumerate(session['targets'])
+        }
+
     def _generate_markdown(self, session: Dict) -> str:
         """Generate markdown summary for a session"""
-        lines = []
-
-        lines.append(f"# RV Session: {session.get('name', session['id'])}")
-        lines.append('')
-        lines.append(f"**Session ID:** {session['id']}")
-        lines.append(f"**Created:** {format_timestamp(session['createdAt'])}")
-        lines.append(f"**Reveal At:** {format_timestamp(session['revealAt'])}")
-        lines.append(f"**Number of Targets:** {len(session['targets'])}")
-        lines.append('')
-
-        if session.get('notes'):
-            lines.append('## Notes')
-            lines.append('')
-            lines.append(session['notes'])
-            lines.append('')
-
-        lines.append('## Targets')
-        lines.append('')
-
-        for i, target in enumerate(session['targets'], 1):
-            lines.append(f"### Target {i}: {target['code']}")
-            lines.append('')
-            lines.append(f"**Code:** `{target['code']}`")
-            status = 'Revealed' if target['revealed'] else 'Pending'
-            lines.append(f"**Status:** {status}")
-            lines.append(f"**Source:** {target['targetSource']}")
-            lines.append('')
-            lines.append('**Description:**')
-            lines.append('')
-            lines.append(target['targetDescription'])
-            lines.append('')
-
-            # Generate appropriate link text based on source
-            source = target.get('targetSource', 'unsplash')
-            target_url = target['targetUrl']
-            location_url = target.get('targetLocationUrl')
-
-            if source == 'google_streetview':
-                lines.append('**Street View:**')
-                lines.append('')
-                lines.append('[View Interactive Panorama](' + target_url + ')')
-                if location_url:
-                    lines.append(' • [View Location on Map](' + location_url + ')')
-            elif source == 'unsplash':
-                lines.append('**Image:**')
-                lines.append('')
-                lines.append(f"![Target Image]({target_url})")
-                lines.append('')
-                lines.append(f"[View on Unsplash]({target_url})")
-            else:
-                lines.append('**Image:**')
-                lines.append('')
-                lines.append(f"![Target Image]({target_url})")
-                lines.append('')
-                lines.append(f"[View Source]({target_url})")
-
-            lines.append('')
-
-            # Add metadata for Street View
-            if source == 'google_streetview':
-                if target.get('targetDate'):
-                    formatted_date = format_capture_date(target['targetDate'])
-                    lines.append(f"**Captured:** {formatted_date}")
-                    lines.append('')
-
-            if target.get('revealedAt'):
-                lines.append(f"**Revealed At:** {format_timestamp(target['revealedAt'])}")
-
-            lines.append('')
-            lines.append('---')
-            lines.append('')
-
-        lines.append('')
-        lines.append('---')
-        lines.append('')
-        lines.append('*Generated by Glimpse RV Testing CLI*')
-
-        return '\n'.join(lines)
+        notes = f"## Notes\n\n{session['notes']}\n\n" if session.get('notes') else ''
+
+        header = (
+            f"# RV Session: {session.get('name', session['id'])}\n"
+            f"\n"
+            f"**Session ID:** {session['id']}\n"
+            f"**Created:** {_fmt_dt(session.get('_created_dt', session['createdAt']))}\n"
+            f"**Reveal At:** {_fmt_dt(session.get('_reveal_dt', session['revealAt']))}\n"
+            f"**Number of Targets:** {len(session['targets'])}\n"
+            f"\n"
+            f"{notes}"
+            f"## Targets\n"
+            f"\n"
+        )
+
+        target_blocks = ''.join(_render_target(i, target) for i, target in enumerate(session['targets'], 1))
+
+        return header + target_blocks + _MARKDOWN_FOOTER
 
     def ensure_data_directory(self):
         """Ensure the data directory exists"""
         Path(self.sessions_dir).mkdir(parents=True, exist_ok=True)
 
-    def save_session(self, session: Dict):
-        """Save a session to JSON and markdown files"""
+    def save_session(self, session: Dict, write_markdown: bool = True):
+        """
+        Save a session to JSON and markdown files
+
+        Args:
+            session: Session data to save
+            write_markdown: Regenerate session.md (default: True). It is
+                always written if the file doesn't exist yet.
+        """
         self.ensure_data_directory()
 
-        session_dir = self._get_session_dir(session['id'], session)
+        # Save into the session's existing folder, whatever its naming scheme,
+        # so a re-save never leaves a duplicate folder behind
+        session_dir = self._find_session_dir(session['id']) or self._get_session_dir(session['id'], session)
         json_path = os.path.join(session_dir, 'session.json')
         md_path = os.path.join(session_dir, 'session.md')
 
         # Create session directory
         Path(session_dir).mkdir(parents=True, exist_ok=True)
+        self._sync_dir_index(session['id'], os.path.basename(session_dir))
 
-        # Save JSON file
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(session, f, indent=2, ensure_ascii=False)
+        # Save JSON file, leaving out in-memory caches
+        stored = {key: value for key, value in session.items() if not key.startswith('_')}
+        _write_atomic(json_path, _dumps(stored))
+
+        # The full session now includes any journaled updates
+        try:
+            os.remove(os.path.join(session_dir, 'journal.jsonl'))
+        except FileNotFoundError:
+            pass
 
         # Save markdown file
-        markdown = self._generate_markdown(session)
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(markdown)
+        if write_markdown or not os.path.exists(md_path):
+            _write_atomic(md_path, self._generate_markdown(session).encode('utf-8'))
+
+        # Keep the code index in sync
+        code_map = self._get_code_map()
+        code_map.update(self._index_entries(session, os.path.basename(session_dir)))
+        self._save_index(code_map)
+
+    def _read_session_dir(self, session_dir: str) -> Dict:
+        """
+        Read a session from its directory, replaying any journaled updates
+
+        The number of journal entries is kept on the session as '_journal_length'.
+
+        Raises:
+            FileNotFoundError: If the session has no session.json
+        """
+        with open(os.path.join(session_dir, 'session.json'), 'rb') as f:
+            session = _loads(f.read())
+
+        journal_length = 0
+        try:
+            with open(os.path.join(session_dir, 'journal.jsonl'), 'rb') as f:
+                for line in f:
+                    journal_length += 1
+                    try:
+                        entry = _loads(line)
+                    except ValueError:
+                        # Skip a partially written trailing entry
+                        continue
+                    session['targets'][entry['target']].update(entry['patch'])
+        except FileNotFoundError:
+            pass
+
+        session['_journal_length'] = journal_length
+        return session
 
     def get_session(self, session_id: str) -> Optional[Dict]:
-        """Get a session by ID"""
-        json_path = self._get_session_path(session_id)
+        """
+        Get a session by ID
 
+        Timestamps listed in _DATETIME_FIELDS are parsed once here and cached
+        on the returned dictionary (e.g. '_created_dt').
+        """
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            session = self._read_session_dir(self._get_session_dir(session_id))
         except FileNotFoundError:
             return None
 
-    def get_all_sessions(self) -> List[Dict]:
-        """Get all sessions"""
-        self.ensure_data_directory()
+        for field, cache_key in _DATETIME_FIELDS.items():
+            try:
+                session[cache_key] = datetime.fromisoformat(session[field])
+            except (KeyError, TypeError, ValueError):
+                pass
 
-        sessions = []
+        return session
+
+    def _load_all_sessions(self) -> List[Tuple[str, Dict]]:
+        """Load every session from disk, paired with its folder name"""
+        # scandir's DirEntry caches the entry type, avoiding a stat per entry;
+        # each folder is read directly rather than re-resolved by session ID
+        with os.scandir(self.sessions_dir) as entries:
+            folders = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+
+        if not folders:
+            return []
+
+        def read(folder):
+            try:
+                return self._read_session_dir(folder[1])
+            except (FileNotFoundError, ValueError):
+                return None
+
+        # Session files are small and I/O bound, so read them in parallel
+        with ThreadPoolExecutor(max_workers=min(16, len(folders))) as executor:
+            sessions = list(executor.map(read, folders))
+
+        return [(folder[0], session) for folder, session in zip(folders, sessions) if session]
+
+    def get_all_sessions(self) -> List[Session]:
+        """Get all sessions as typed records, newest first"""
+        self.ensure_data_directory()
 
         try:
-            for entry in os.listdir(self.sessions_dir):
-                entry_path = os.path.join(self.sessions_dir, entry)
-                if os.path.isdir(entry_path):
-                    # Extract session_id from folder name
-                    # Format: {timestamp}_{session_id} or just {session_id}
-                    if '_' in entry and len(entry.split('_')[0]) == 12:
-                        # New format with timestamp
-                        session_id = entry.split('_', 1)[1]
-                    else:
-                        # Old format or session_id only
-                        session_id = entry
-
-                    session = self.get_session(session_id)
-                    if session:
-                        sessions.append(session)
+            loaded = self._load_all_sessions()
         except FileNotFoundError:
             return []
 
-        # Sort by creation date (newest first)
-        def get_datetime(session):
+        # Hydrate sessions and rebuild the code index from what is actually on disk
+        sessions = []
+        index = {}
+        for folder_name, data in loaded:
             try:
-                dt = datetime.fromisoformat(session['createdAt'])
-                # Make naive if it has timezone info
-                if dt.tzinfo is not None:
-                    dt = dt.replace(tzinfo=None)
-                return dt
-            except Exception:
-                return datetime.min
+                session = Session.from_dict(data)
+                entries = self._index_entries(data, folder_name)
+            except (KeyError, TypeError, ValueError):
+                # Skip a malformed session rather than failing the whole listing
+                continue
+            sessions.append(session)
+            index.update(entries)
+
+        # Sort by creation date (newest first)
+        sessions.sort(key=lambda s: s.created_at, reverse=True)
 
-        sessions.sort(key=get_datetime, reverse=True)
+        if index != self._get_code_map():
+            self._save_index(index)
+        self._code_map = index
 
         return sessions
 
+    def iter_session_summaries(self) -> Iterator[Dict]:
+        """
+        Iterate over lightweight summaries of all sessions
+
+        Sessions are read one at a time and reduced to the fields needed for
+        status reporting, so full target details are never held in memory.
+
+        Yields:
+            Dictionaries with id, name, createdAt, revealAt, revealAtEpoch and targets
+            (each target reduced to code and revealed)
+        """
+        self.ensure_data_directory()
+
+        for folder_name in list(self._ensure_dir_index().values()):
+            try:
+                session = self._read_session_dir(os.path.join(self.sessions_dir, folder_name))
+
+                # Reject the same sessions Session.from_dict does, so status
+                # and list agree on what counts as a session
+                parse_naive_datetime(session['createdAt'])
+                parse_naive_datetime(session['revealAt'])
+
+                summary = {
+                    'id': session['id'],
+                    'name': session.get('name'),
+                    'createdAt': session['createdAt'],
+                    'revealAt': session['revealAt'],
+                    'revealAtEpoch': get_reveal_epoch(session),
+                    'targets': [
+                        {'code': t['code'], 'revealed': t['revealed']}
+                        for t in session['targets']
+                    ]
+                }
+            except (FileNotFoundError, KeyError, TypeError, ValueError):
+                # Missing or malformed sessions are skipped, as in get_all_sessions
+                continue
+
+            yield summary
+
+    def find_target(self, code: str) -> Optional[Tuple[Dict, int]]:
+        """
+        Find the session containing a target code
+
+        Args:
+            code: Target code (separators and case are ignored)
+
+        Returns:
+            Tuple of (session, target index), or None if not found
+        """
+        normalized_code = normalize_code(code)
+
+        # Fast path: look the code up in the index and load just that session
+        match = self._lookup_code(normalized_code)
+        if match:
+            return match
+
+        # Index is missing or stale: rescan all sessions to rebuild it, then retry
+        self.get_all_sessions()
+        return self._lookup_code(normalized_code)
+
+    def _lookup_code(self, normalized_code: str) -> Optional[Tuple[Dict, int]]:
+        """Load the session holding a code according to the code index"""
+        entry = self._get_code_map().get(normalized_code)
+        if not entry:
+            return None
+
+        try:
+            session = self._read_session_dir(os.path.join(self.sessions_dir, entry['folder']))
+            target = session['targets'][entry['target']]
+        except (FileNotFoundError, ValueError, KeyError, IndexError):
+            return None
+
+        if self._target_code(target) != normalized_code:
+            return None
+        return session, entry['target']
+
+    def put_blob(self, data: bytes) -> str:
+        """
+        Store binary content (e.g. a cached image) outside the session JSON
+
+        Blobs are content-addressed, so storing the same bytes twice is a no-op.
+        Targets should reference the returned hash (e.g. as 'targetImageBlob')
+        rather than embedding the bytes.
+
+        Args:
+            data: Binary content to store
+
+        Returns:
+            SHA-256 hex digest identifying the blob
+        """
+        blob_hash = hashlib.sha256(data).hexdigest()
+        blob_path = os.path.join(self.blobs_dir, f'{blob_hash}.bin')
+
+        # Written atomically, so an existing blob is always complete
+        if not os.path.exists(blob_path):
+            Path(self.blobs_dir).mkdir(parents=True, exist_ok=True)
+            _write_atomic(blob_path, data)
+
+        return blob_hash
+
+    def get_blob(self, blob_hash: str) -> Optional[bytes]:
+        """Get binary content previously stored with put_blob"""
+        if not _BLOB_HASH_RE.fullmatch(blob_hash):
+            return None
+
+        try:
+            with open(os.path.join(self.blobs_dir, f'{blob_hash}.bin'), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def update_target(self, session_id: str, target_index: int, patch: Dict,
+                      session: Optional[Dict] = None):
+        """
+        Update fields on a single target without rewriting the session files
+
+        The patch is appended to the session's journal and replayed whenever
+        the session is read, and the markdown summary is regenerated. Once the
+        journal holds JOURNAL_COMPACT_THRESHOLD entries, or one per target
+        (e.g. every target revealed), the session is saved in full and the
+        journal is cleared.
+
+        Args:
+            session_id: The session ID
+            target_index: Index of the target within the session
+            patch: Target fields to set
+            session: The session as already read by the caller (e.g. from
+                find_target), to avoid reading it again
+        """
+        session_dir = self._get_session_dir(session_id)
+
+        if session is None:
+            try:
+                session = self._read_session_dir(session_dir)
+            except FileNotFoundError:
+                raise Exception(f'Session {session_id} not found')
+
+        if not 0 <= target_index < len(session['targets']):
+            raise Exception(f'Session {session_id} has no target {target_index}')
+
+        entry = {'target': target_index, 'patch': patch, 'ts': datetime.now().isoformat()}
+        with open(os.path.join(session_dir, 'journal.jsonl'), 'ab') as f:
+            f.write(_dumps(entry, indent=False) + b'\n')
+
+        session['targets'][target_index].update(patch)
+        session['_journal_length'] = session.get('_journal_length', 0) + 1
+
+        if session['_journal_length'] >= min(JOURNAL_COMPACT_THRESHOLD, len(session['targets'])):
+            self.save_session(session)
+            return
+
+        # Keep the markdown summary current
+        _write_atomic(os.path.join(session_dir, 'session.md'), self._generate_markdown(session).encode('utf-8'))
+
     def update_session(self, session_id: str, updates: Dict):
         """Update a session with partial data"""
         session = self.get_session(session_id)
@@ -225,7 +618,18 @@ class StorageService:
             raise Exception(f'Session {session_id} not found')
 
         session.update(updates)
-        self.save_session(session)
+
+        # Drop cached datetimes for timestamps that were just replaced
+        for field, cache_key in _DATETIME_FIELDS.items():
+            if field in updates:
+                session.pop(cache_key, None)
+
+        # Keep the stored reveal epoch in step with a new revealAt
+        if 'revealAt' in updates and 'revealAtEpoch' not in updates:
+            session.pop('revealAtEpoch', None)
+            session['revealAtEpoch'] = int(get_reveal_epoch(session))
+
+        self.save_session(session, write_markdown=not MARKDOWN_FIELDS.isdisjoint(updates))
 
     def delete_session(self, session_id: str):
         """Delete a session"""
@@ -235,3 +639,12 @@ class StorageService:
             shutil.rmtree(session_dir)
         except FileNotFoundError:
             raise Exception(f'Session {session_id} not found')
+
+        self._sync_dir_index(session_id, None)
+
+        # Drop the session's codes from the index
+        code_map = self._get_code_map()
+        remaining = {code: entry for code, entry in code_map.items() if entry['sessionId'] != session_id}
+        if remaining != code_map:
+            self._save_index(remaining)
+        self._code_map = remaining
@@ -1,7 +1,10 @@
 """Unsplash API service for fetching random images"""
 
 import requests
-from typing import Dict
+from requests.adapters import HTTPAdapter
+from typing import Dict, List
+
+from glimpse.utils.rate_limit import get_with_retry
 
 
 class UnsplashService:
@@ -14,6 +17,16 @@ class UnsplashService:
         self.base_url = 'https://api.unsplash.com'
         self.name = 'unsplash'
 
+        # Reuse connections (and the auth header) across requests, with a
+        # pool large enough for the concurrent fetches in create
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self.session.headers.update({'Authorization': f'Client-ID {access_key}'})
+
+        # Unsplash's limit is per hour (50 requests for demo applications),
+        # which an in-process limiter can't track across CLI runs. Requests
+        # are not throttled locally; get_with_retry only retries on HTTP 429.
+
     def fetch_random_image(self) -> Dict[str, str]:
         """
         Fetch a random image from Unsplash
@@ -25,30 +38,61 @@ class UnsplashService:
             Exception: If the API request fails
         """
         try:
-            response = requests.get(
+            response = get_with_retry(
+                self.session,
+                None,
                 f'{self.base_url}/photos/random',
-                headers={'Authorization': f'Client-ID {self.access_key}'},
                 params={'orientation': 'landscape'},
                 timeout=30
             )
             response.raise_for_status()
 
-            photo = response.json()
-
-            return {
-                'url': photo['urls']['regular'],
-                'description': photo.get('description') or photo.get('alt_description') or 'No description available',
-                'sourceUrl': photo['links']['html']
-            }
+            return self._format_photo(response.json())
         except requests.exceptions.RequestException as e:
             raise Exception(f'Failed to fetch image from Unsplash: {str(e)}')
 
+    def fetch_random_images(self, count: int) -> List[Dict[str, str]]:
+        """
+        Fetch several random images from Unsplash in a single request
+
+        Args:
+            count: Number of images to fetch (Unsplash allows up to 30)
+
+        Returns:
+            List of dictionaries with url, description, and sourceUrl keys
+
+        Raises:
+            Exception: If the API request fails
+        """
+        try:
+            response = get_with_retry(
+                self.session,
+                None,
+                f'{self.base_url}/photos/random',
+                params={'orientation': 'landscape', 'count': count},
+                timeout=30
+            )
+            response.raise_for_status()
+
+            return [self._format_photo(photo) for photo in response.json()]
+        except requests.exceptions.RequestException as e:
+            raise Exception(f'Failed to fetch images from Unsplash: {str(e)}')
+
+    def _format_photo(self, photo: Dict) -> Dict[str, str]:
+        """Convert an Unsplash photo object to an image dictionary"""
+        return {
+            'url': photo['urls']['regular'],
+            'description': photo.get('description') or photo.get('alt_description') or 'No description available',
+            'sourceUrl': photo['links']['html']
+        }
+
     def test_connection(self) -> bool:
         """Test the Unsplash API connection"""
         try:
-            response = requests.get(
+            response = get_with_retry(
+                self.session,
+                None,
                 f'{self.base_url}/photos/random',
-                headers={'Authorization': f'Client-ID {self.access_key}'},
                 timeout=10
             )
             response.raise_for_status()
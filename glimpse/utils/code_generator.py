@@ -4,9 +4,28 @@ Format: XXXX-XXXX (8 characters with dash separator)
 """
 
 import secrets
+from typing import List
 
 CROCKFORD_ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
 
+# Maps every byte value to an alphabet character via its low 5 bits.
+# 256 is a multiple of 32, so random bytes give uniformly random characters.
+_BYTE_TO_CHAR = bytes(CROCKFORD_ALPHABET.encode('ascii')[i & 0x1F] for i in range(256))
+
+_ALPHABET_SET = frozenset(CROCKFORD_ALPHABET)
+
+
+def _random_chars(count: int) -> str:
+    """Draw count random alphabet characters from a single secure RNG call"""
+    return secrets.token_bytes(count).translate(_BYTE_TO_CHAR).decode('ascii')
+
+
+def _format_code(chars: str, separator: str, separator_position: int) -> str:
+    """Insert the separator into a run of code characters"""
+    if 0 < separator_position < len(chars):
+        return chars[:separator_position] + separator + chars[separator_position:]
+    return chars
+
 
 def generate_code(length: int = 8, separator: str = '-', separator_position: int = 4) -> str:
     """
@@ -20,15 +39,40 @@ def generate_code(length: int = 8, separator: str = '-', separator_position: int
     Returns:
         Formatted code (e.g., "XXXX-XXXX")
     """
-    code = ''
-    for i in range(length):
-        code += secrets.choice(CROCKFORD_ALPHABET)
+    return _format_code(_random_chars(length), separator, separator_position)
+
+
+def generate_codes(count: int, length: int = 8, separator: str = '-',
+                   separator_position: int = 4) -> List[str]:
+    """
+    Generates several unique random Crockford Base32 codes at once
+
+    Args:
+        count: Number of codes to generate
+        length: Total number of characters per code (default: 8)
+        separator: Separator character (default: '-')
+        separator_position: Position to insert separator (default: 4)
+
+    Returns:
+        List of distinct formatted codes (e.g., ["XXXX-XXXX", ...])
+    """
+    codes = []
+    seen = set()
+
+    while len(codes) < count:
+        # Draw characters for all remaining codes (plus one spare) in one call
+        needed = count - len(codes) + 1
+        chars = _random_chars(length * needed)
 
-        # Insert separator at specified position
-        if i == separator_position - 1 and i < length - 1:
-            code += separator
+        for start in range(0, len(chars), length):
+            code = _format_code(chars[start:start + length], separator, separator_position)
+            if code not in seen:
+                seen.add(code)
+                codes.append(code)
+                if len(codes) == count:
+                    break
 
-    return code
+    return codes
 
 
 def validate_code(code: str) -> bool:
@@ -45,7 +89,7 @@ def validate_code(code: str) -> bool:
     clean_code = code.replace('-', '').upper()
 
     # Check if all characters are valid Crockford Base32
-    return all(char in CROCKFORD_ALPHABET for char in clean_code)
+    return _ALPHABET_SET.issuperset(clean_code)
 
 
 def normalize_code(code: str) -> str:
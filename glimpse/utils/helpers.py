@@ -2,6 +2,7 @@
 
 import os
 from datetime import datetime
+from typing import Dict
 
 
 def get_data_dir() -> str:
@@ -14,6 +15,38 @@ def get_data_dir() -> str:
     return os.path.join(os.getcwd(), 'data')
 
 
+def parse_naive_datetime(iso_timestamp: str) -> datetime:
+    """
+    Parse an ISO timestamp into a naive datetime
+
+    Args:
+        iso_timestamp: ISO 8601 timestamp, with or without timezone info
+
+    Returns:
+        Datetime with any timezone info dropped
+    """
+    dt = datetime.fromisoformat(iso_timestamp)
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return dt
+
+
+def get_reveal_epoch(session: Dict) -> float:
+    """
+    Get a session's reveal time as a Unix timestamp
+
+    Args:
+        session: Session dictionary
+
+    Returns:
+        The stored revealAtEpoch, or the parsed revealAt for older sessions
+    """
+    epoch = session.get('revealAtEpoch')
+    if epoch is None:
+        return parse_naive_datetime(session['revealAt']).timestamp()
+    return epoch
+
+
 def format_capture_date(date_str: str) -> str:
     """
     Format Street View capture date from YYYY-MM to readable format
@@ -0,0 +1,89 @@
+"""
+Rate limiting helpers for image service HTTP calls
+Token bucket limiter plus retry with exponential backoff on HTTP 429
+"""
+
+import threading
+import time
+from typing import Optional
+
+import requests
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter"""
+
+    def __init__(self, rate: float, per: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Number of requests allowed per period
+            per: Period length in seconds
+            capacity: Maximum burst size (default: rate)
+        """
+        self.capacity = capacity if capacity is not None else rate
+        self.fill_rate = rate / per
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.fill_rate)
+        self.updated_at = now
+
+    def available(self) -> int:
+        """Get the number of requests that can be made right now"""
+        with self._lock:
+            self._refill()
+            return int(self.tokens)
+
+    def acquire(self):
+        """Take one token, blocking until one is available"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+def get_with_retry(session: requests.Session, limiter: Optional[TokenBucket], url: str,
+                   max_attempts: int = 5, backoff: float = 1.0, max_wait: float = 60.0,
+                   **kwargs) -> requests.Response:
+    """
+    Send a rate-limited GET request, retrying with exponential backoff on HTTP 429
+
+    Args:
+        session: Session to send the request with
+        limiter: Token bucket gating each attempt, or None to send unthrottled
+        url: Request URL
+        max_attempts: Maximum number of attempts (default: 5)
+        backoff: Initial delay in seconds, doubled after each attempt (default: 1.0)
+        max_wait: Longest single wait in seconds (default: 60.0)
+        **kwargs: Passed through to session.get
+
+    Returns:
+        The final response (which may still be a 429 once attempts run out)
+    """
+    delay = backoff
+
+    for attempt in range(max_attempts):
+        if limiter is not None:
+            limiter.acquire()
+        response = session.get(url, **kwargs)
+
+        if response.status_code != 429 or attempt == max_attempts - 1:
+            return response
+
+        # Honour Retry-After when the server provides it
+        retry_after = response.headers.get('Retry-After')
+        try:
+            wait = float(retry_after) if retry_after else delay
+        except ValueError:
+            wait = delay
+        time.sleep(min(wait, max_wait))
+        delay *= 2
+
+    return response
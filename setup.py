@@ -12,6 +12,9 @@ setup(
         'requests>=2.31.0',
         'python-dotenv>=1.0.0',
     ],
+    extras_require={
+        'fast': ['orjson>=3.9.0'],
+    },
     entry_points={
         'console_scripts': [
             'glimpse=glimpse.cli:cli',